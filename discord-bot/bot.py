@@ -22,6 +22,8 @@ POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "60"))
 SOLVES_FILE = os.getenv("SOLVES_FILE", "solves.json")
 STATE_FILE = os.getenv("STATE_FILE", "state.json")
 MENTION_ROLE_ID = os.getenv("MENTION_ROLE_ID", "0")
+# Opsional: cache mention member juga (butuh Server Members Intent aktif di Developer Portal)
+MENTION_CACHE_MEMBERS = os.getenv("MENTION_CACHE_MEMBERS", "0") == "1"
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +31,8 @@ logger = logging.getLogger("ctf-bot")
 
 # Discord client
 intents = Intents.default()
+if MENTION_CACHE_MEMBERS:
+    intents.members = True
 client = discord.Client(intents=intents)
 
 
@@ -59,28 +63,66 @@ def save_solves(solves: List[Dict[str, Any]]):
         json.dump(solves, f, indent=2)
 
 
+# Cache hasil resolve mention per (guild_id, identifier), di-reset lewat event role/member.
+# Mention member hanya di-cache kalau members intent aktif (tanpa itu event member tidak datang).
+# Yang gagal di-resolve tidak di-cache, supaya dicoba lagi di announcement berikutnya.
+mention_cache: Dict[int, Dict[str, str]] = {}
+
+
+def invalidate_mentions(guild):
+    if guild is not None:
+        mention_cache.pop(guild.id, None)
+
+
+def invalidate_member_mentions(guild, *members):
+    """Hapus entry yang bisa bergantung ke member ini saja, bukan satu guild"""
+    cache = mention_cache.get(guild.id) if guild is not None else None
+    if not cache:
+        return
+
+    keys = set()
+    mentions = set()
+    for m in members:
+        keys.update(k for k in (str(m.id), m.name, getattr(m, "nick", None), m.global_name) if k)
+        mentions.add(m.mention)
+
+    for identifier in list(cache):
+        if identifier in keys or cache[identifier] in mentions:
+            del cache[identifier]
+
+
 def resolve_mention(channel, identifier: str) -> str:
     guild = getattr(channel, "guild", None)
     if not guild:
         return f"@{identifier}"
 
+    cache = mention_cache.setdefault(guild.id, {})
+    mention = cache.get(identifier)
+    if mention is not None:
+        return mention
+
+    target = _lookup_mention(guild, identifier)
+    if target is None:
+        return f"@{identifier}"
+    if isinstance(target, discord.Role) or client.intents.members:
+        cache[identifier] = target.mention
+    return target.mention
+
+
+def _lookup_mention(guild, identifier: str):
     if identifier.isdigit():
         member = guild.get_member(int(identifier))
         if member:
-            return member.mention
+            return member
         role = guild.get_role(int(identifier))
         if role:
-            return role.mention
+            return role
 
     member = guild.get_member_named(identifier)
     if member:
-        return member.mention
+        return member
 
-    role = discord.utils.get(guild.roles, name=identifier)
-    if role:
-        return role.mention
-
-    return f"@{identifier}"
+    return discord.utils.get(guild.roles, name=identifier)
 
 def format_relative_date(iso_date: str) -> str:
     try:
@@ -328,6 +370,53 @@ async def on_ready():
 
     asyncio.create_task(poll_loop())
 
+
+# Member/role berubah -> mention yang di-cache bisa basi.
+# Event member cuma datang kalau MENTION_CACHE_MEMBERS aktif.
+@client.event
+async def on_member_join(member):
+    invalidate_member_mentions(member.guild, member)
+
+
+@client.event
+async def on_member_update(before, after):
+    if before.nick != after.nick:
+        invalidate_member_mentions(after.guild, before, after)
+
+
+@client.event
+async def on_member_remove(member):
+    invalidate_member_mentions(member.guild, member)
+
+
+@client.event
+async def on_user_update(before, after):
+    # Ganti username/global name -> get_member_named di semua guild bisa basi
+    if before.name != after.name or before.global_name != after.global_name:
+        for guild in after.mutual_guilds:
+            invalidate_member_mentions(guild, before, after)
+
+
+@client.event
+async def on_guild_remove(guild):
+    invalidate_mentions(guild)
+
+
+@client.event
+async def on_guild_role_create(role):
+    invalidate_mentions(role.guild)
+
+
+@client.event
+async def on_guild_role_update(before, after):
+    invalidate_mentions(after.guild)
+
+
+@client.event
+async def on_guild_role_delete(role):
+    invalidate_mentions(role.guild)
+
+
 def main():
     if not DISCORD_TOKEN:
         logger.error("DISCORD_TOKEN not set. Exiting.")
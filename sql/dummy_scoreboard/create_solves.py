@@ -1,48 +1,135 @@
+import json
+import math
+import os
 import random
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 users = [f"00000000-0000-0000-0000-0000000000{i:02d}" for i in range(1, 29)]
 challenges = [f"10000000-0000-0000-0000-0000000000{i:02d}" for i in range(1, 21)]
 
 start_id = 96
-total_solves = 50
-
-# def random_timestamp():
-#     now = datetime.now()
-#     delta_days = random.randint(0, 4)
-#     random_time = timedelta(
-#         hours=random.randint(0, 23),
-#         minutes=random.randint(0, 59),
-#         seconds=random.randint(0, 59)
-#     )
-#     return (now - timedelta(days=delta_days) + random_time).strftime("%Y-%m-%d %H:%M:%S")
-
-def random_timestamp():
-    now = datetime.now()
-    past = now - timedelta(days=4)
-    random_seconds = random.randint(0, int((now - past).total_seconds()))
-    ts = past + timedelta(seconds=random_seconds)
-    return ts.strftime("%Y-%m-%d %H:%M:%S")
-
-used_pairs = set()
-rows = []
-counter = 0
+# Seed + akhir event tetap supaya file yang di-commit bisa dibuat ulang persis.
+# Contoh data baru relatif ke sekarang: SEED=7 EVENT_END=now python create_solves.py
+seed = int(os.getenv("SEED", "2025"))
+event_end_env = os.getenv("EVENT_END", "2025-09-25 21:00:00+07:00")
+
+tz = ZoneInfo("Asia/Jakarta")
+
+# --------------------------
+# Model timeline event
+# --------------------------
+event_hours = 48
+release_waves = 4  # challenge dirilis bertahap tiap event_hours / release_waves jam
+
+# Sesuai urutan difficulty di dummy_user_challenges.sql (Easy, Medium, Hard, Medium, Hard, ...)
+difficulty_cycle = ["Easy", "Medium", "Hard", "Medium", "Hard"]
+
+# solve_rate: peluang user rata-rata nge-solve
+# median_minutes / spread: kurva lognormal jarak rilis -> solve (rush di awal, ekor panjang)
+difficulty_profile = {
+    "Easy":   {"solve_rate": 0.75, "median_minutes": 25,  "spread": 1.0},
+    "Medium": {"solve_rate": 0.40, "median_minutes": 120, "spread": 1.1},
+    "Hard":   {"solve_rate": 0.15, "median_minutes": 420, "spread": 1.2},
+}
+
+# Bobot aktivitas per jam WIB (Asia/Jakarta); jam 02-07 sepi, malam paling ramai
+diurnal_weight = [
+    0.35, 0.25, 0.15, 0.10, 0.10, 0.15, 0.25, 0.45,
+    0.60, 0.70, 0.75, 0.80, 0.80, 0.75, 0.75, 0.80,
+    0.85, 0.90, 0.95, 1.00, 1.00, 1.00, 0.85, 0.60,
+]
+
+# Balapan first blood: beberapa solver pertama selisih cuma beberapa detik
+first_blood_race_rate = 0.5
+first_blood_race_size = (2, 4)
+first_blood_race_seconds = 5
+
+random.seed(seed)
+
+if event_end_env == "now":
+    event_end = datetime.now(tz).replace(microsecond=0)
+else:
+    event_end = datetime.fromisoformat(event_end_env)
+    # Tanpa offset dianggap WIB, bukan jam lokal host
+    if event_end.tzinfo is None:
+        event_end = event_end.replace(tzinfo=tz)
+    else:
+        event_end = event_end.astimezone(tz)
+event_start = event_end - timedelta(hours=event_hours)
+wave_gap = timedelta(hours=event_hours / release_waves)
+
+# Skill user: sebagian kecil user kuat, sisanya pemula
+user_skill = {uid: random.betavariate(2, 3) * 2 for uid in users}
+
+releases = {}
+for i, cid in enumerate(challenges):
+    releases[cid] = event_start + wave_gap * (i % release_waves)
+
+
+def difficulty_of(index: int) -> str:
+    return difficulty_cycle[index % len(difficulty_cycle)]
 
-while len(rows) < total_solves:
-    user_id = random.choice(users)
-    challenge_id = random.choice(challenges)
-    pair = (user_id, challenge_id)
 
-    if pair in used_pairs:
-        continue  # skip duplikat
+def solve_delay(profile, skill: float) -> timedelta:
+    # User kuat lebih cepat: median dibagi skill
+    median = profile["median_minutes"] / max(skill, 0.2)
+    minutes = random.lognormvariate(math.log(median), profile["spread"])
+    return timedelta(minutes=minutes)
 
-    used_pairs.add(pair)
+
+def solve_time(release: datetime, profile, skill: float):
+    # Thinning: tolak waktu di jam sepi, geser dan coba lagi (solver tidur dulu)
+    # Dibulatkan ke detik, sama dengan presisi yang ditulis ke output
+    t = (release + solve_delay(profile, skill)).replace(microsecond=0)
+    while t < event_end:
+        if random.random() < diurnal_weight[t.astimezone(tz).hour]:
+            return t
+        t += timedelta(minutes=random.randint(20, 90))
+    return None
+
+
+solves = []  # (created_at, user_id, challenge_id)
+for i, cid in enumerate(challenges):
+    profile = difficulty_profile[difficulty_of(i)]
+    release = releases[cid]
+    times = []
+    for uid in users:
+        skill = user_skill[uid]
+        if random.random() >= min(profile["solve_rate"] * skill, 0.98):
+            continue
+        t = solve_time(release, profile, skill)
+        if t is not None:
+            times.append((t, uid))
+
+    times.sort()
+    if len(times) >= 2 and random.random() < first_blood_race_rate:
+        size = min(random.randint(*first_blood_race_size), len(times))
+        first_t = times[0][0]
+        for k in range(1, size):
+            offset = timedelta(seconds=random.randint(1, first_blood_race_seconds))
+            times[k] = (min(first_t + offset, event_end), times[k][1])
+        times.sort()
+
+    # First blood harus unik: solver lain minimal 1 detik setelahnya
+    for k in range(1, len(times)):
+        if times[k][0] <= times[0][0]:
+            times[k] = (times[0][0] + timedelta(seconds=1), times[k][1])
+
+    for t, uid in times:
+        solves.append((t, uid, cid))
+
+solves.sort()
+
+rows = []
+for counter, (t, uid, cid) in enumerate(solves):
     num = start_id + counter
     solve_id = f"20000000-0000-0000-0000-{num:012d}"
-    created_at = random_timestamp()
-    rows.append((solve_id, user_id, challenge_id, created_at))
-    counter += 1
+    rows.append((solve_id, uid, cid, t.isoformat(sep=" ")))
 
+# --------------------------
+# Output: INSERT, COPY, event stream
+# --------------------------
 with open("dummy_solves.sql", "w") as f:
     f.write("DELETE FROM public.solves WHERE id::text LIKE '20000000-%';\n\nINSERT INTO public.solves (id, user_id, challenge_id, created_at) VALUES\n")
     for i, (sid, uid, cid, ts) in enumerate(rows):
@@ -53,4 +140,41 @@ with open("dummy_solves.sql", "w") as f:
             line += "ON CONFLICT (user_id, challenge_id) DO NOTHING;\n"
         f.write(line)
 
-print("✅ dummy_solves.sql siap tanpa duplikat (user_id, challenge_id).")
+# Khusus psql (psql -f dummy_solves_copy.sql), COPY FROM stdin tidak jalan di SQL editor Supabase.
+# Lewat temp table biar pasangan (user_id, challenge_id) yang sudah ada di-skip, bukan bikin gagal.
+with open("dummy_solves_copy.sql", "w") as f:
+    f.write("DELETE FROM public.solves WHERE id::text LIKE '20000000-%';\n\n")
+    f.write("CREATE TEMP TABLE tmp_dummy_solves (LIKE public.solves INCLUDING DEFAULTS);\n\n")
+    f.write("COPY tmp_dummy_solves (id, user_id, challenge_id, created_at) FROM stdin;\n")
+    for sid, uid, cid, ts in rows:
+        f.write(f"{sid}\t{uid}\t{cid}\t{ts}\n")
+    f.write("\\.\n\n")
+    f.write("INSERT INTO public.solves (id, user_id, challenge_id, created_at)\n")
+    f.write("SELECT id, user_id, challenge_id, created_at FROM tmp_dummy_solves\n")
+    f.write("ON CONFLICT (user_id, challenge_id) DO NOTHING;\n\n")
+    f.write("DROP TABLE tmp_dummy_solves;\n")
+
+# Event stream buat replay: offset detik dari awal event, urut waktu
+events = []
+for cid, release in releases.items():
+    events.append((release, 0, {"type": "release", "challenge_id": cid}))
+first_seen = set()
+for (t, uid, cid), (sid, _, _, _) in zip(solves, rows):
+    event = {
+        "type": "solve",
+        "id": sid,
+        "user_id": uid,
+        "challenge_id": cid,
+        "first_blood": cid not in first_seen,
+    }
+    first_seen.add(cid)
+    events.append((t, 1, event))
+events.sort(key=lambda e: (e[0], e[1]))
+
+with open("dummy_solves_events.jsonl", "w") as f:
+    for t, _, event in events:
+        event["offset_seconds"] = int((t - event_start).total_seconds())
+        event["time"] = t.isoformat(sep=" ")
+        f.write(json.dumps(event) + "\n")
+
+print(f"✅ {len(rows)} solve dibuat: dummy_solves.sql, dummy_solves_copy.sql, dummy_solves_events.jsonl")
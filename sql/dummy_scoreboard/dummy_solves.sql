@@ -1,53 +1,152 @@
 DELETE FROM public.solves WHERE id::text LIKE '20000000-%';
 
 INSERT INTO public.solves (id, user_id, challenge_id, created_at) VALUES
-('20000000-0000-0000-0000-000000000096', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000007', '2025-09-24 16:16:23'),
-('20000000-0000-0000-0000-000000000097', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000020', '2025-09-24 09:24:02'),
-('20000000-0000-0000-0000-000000000098', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000002', '2025-09-22 04:02:18'),
-('20000000-0000-0000-0000-000000000099', '00000000-0000-0000-0000-000000000022', '10000000-0000-0000-0000-000000000018', '2025-09-25 05:36:13'),
-('20000000-0000-0000-0000-000000000100', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000004', '2025-09-24 05:51:07'),
-('20000000-0000-0000-0000-000000000101', '00000000-0000-0000-0000-000000000002', '10000000-0000-0000-0000-000000000009', '2025-09-23 16:58:02'),
-('20000000-0000-0000-0000-000000000102', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000012', '2025-09-22 13:30:01'),
-('20000000-0000-0000-0000-000000000103', '00000000-0000-0000-0000-000000000002', '10000000-0000-0000-0000-000000000005', '2025-09-23 16:23:08'),
-('20000000-0000-0000-0000-000000000104', '00000000-0000-0000-0000-000000000004', '10000000-0000-0000-0000-000000000016', '2025-09-21 17:41:16'),
-('20000000-0000-0000-0000-000000000105', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000011', '2025-09-22 21:44:11'),
-('20000000-0000-0000-0000-000000000106', '00000000-0000-0000-0000-000000000022', '10000000-0000-0000-0000-000000000017', '2025-09-22 09:45:08'),
-('20000000-0000-0000-0000-000000000107', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000016', '2025-09-22 17:41:52'),
-('20000000-0000-0000-0000-000000000108', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000003', '2025-09-24 21:17:22'),
-('20000000-0000-0000-0000-000000000109', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000002', '2025-09-24 12:07:54'),
-('20000000-0000-0000-0000-000000000110', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000014', '2025-09-22 19:17:18'),
-('20000000-0000-0000-0000-000000000111', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000008', '2025-09-22 10:45:30'),
-('20000000-0000-0000-0000-000000000112', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000002', '2025-09-24 06:37:34'),
-('20000000-0000-0000-0000-000000000113', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000014', '2025-09-21 22:34:12'),
-('20000000-0000-0000-0000-000000000114', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000011', '2025-09-21 17:45:03'),
-('20000000-0000-0000-0000-000000000115', '00000000-0000-0000-0000-000000000022', '10000000-0000-0000-0000-000000000005', '2025-09-22 18:09:59'),
-('20000000-0000-0000-0000-000000000116', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000007', '2025-09-24 10:27:44'),
-('20000000-0000-0000-0000-000000000117', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000016', '2025-09-24 06:27:00'),
-('20000000-0000-0000-0000-000000000118', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000018', '2025-09-24 14:24:57'),
-('20000000-0000-0000-0000-000000000119', '00000000-0000-0000-0000-000000000022', '10000000-0000-0000-0000-000000000006', '2025-09-23 15:24:19'),
-('20000000-0000-0000-0000-000000000120', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000010', '2025-09-23 17:00:54'),
-('20000000-0000-0000-0000-000000000121', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000012', '2025-09-24 03:49:09'),
-('20000000-0000-0000-0000-000000000122', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000018', '2025-09-23 13:52:04'),
-('20000000-0000-0000-0000-000000000123', '00000000-0000-0000-0000-000000000021', '10000000-0000-0000-0000-000000000010', '2025-09-23 08:41:56'),
-('20000000-0000-0000-0000-000000000124', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000008', '2025-09-25 06:42:25'),
-('20000000-0000-0000-0000-000000000125', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000019', '2025-09-23 06:49:39'),
-('20000000-0000-0000-0000-000000000126', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000016', '2025-09-22 12:06:12'),
-('20000000-0000-0000-0000-000000000127', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000005', '2025-09-24 06:31:13'),
-('20000000-0000-0000-0000-000000000128', '00000000-0000-0000-0000-000000000021', '10000000-0000-0000-0000-000000000003', '2025-09-21 18:54:08'),
-('20000000-0000-0000-0000-000000000129', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000016', '2025-09-23 11:11:19'),
-('20000000-0000-0000-0000-000000000130', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000001', '2025-09-23 03:18:21'),
-('20000000-0000-0000-0000-000000000131', '00000000-0000-0000-0000-000000000014', '10000000-0000-0000-0000-000000000016', '2025-09-24 19:35:08'),
-('20000000-0000-0000-0000-000000000132', '00000000-0000-0000-0000-000000000021', '10000000-0000-0000-0000-000000000017', '2025-09-23 21:16:19'),
-('20000000-0000-0000-0000-000000000133', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000008', '2025-09-22 16:50:12'),
-('20000000-0000-0000-0000-000000000134', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000019', '2025-09-23 19:19:38'),
-('20000000-0000-0000-0000-000000000135', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000003', '2025-09-22 22:35:57'),
-('20000000-0000-0000-0000-000000000136', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000004', '2025-09-24 06:49:56'),
-('20000000-0000-0000-0000-000000000137', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000016', '2025-09-21 18:21:51'),
-('20000000-0000-0000-0000-000000000138', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000017', '2025-09-25 08:05:53'),
-('20000000-0000-0000-0000-000000000139', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000002', '2025-09-25 10:52:24'),
-('20000000-0000-0000-0000-000000000140', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000020', '2025-09-22 07:57:27'),
-('20000000-0000-0000-0000-000000000141', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000011', '2025-09-23 15:09:25'),
-('20000000-0000-0000-0000-000000000142', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000002', '2025-09-23 11:23:09'),
-('20000000-0000-0000-0000-000000000143', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000011', '2025-09-22 13:47:58'),
-('20000000-0000-0000-0000-000000000144', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000007', '2025-09-23 01:47:58'),
-('20000000-0000-0000-0000-000000000145', '00000000-0000-0000-0000-000000000026', '10000000-0000-0000-0000-000000000002', '2025-09-22 22:27:55')ON CONFLICT (user_id, challenge_id) DO NOTHING;
+('20000000-0000-0000-0000-000000000096', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:05:42+07:00'),
+('20000000-0000-0000-0000-000000000097', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:05:43+07:00'),
+('20000000-0000-0000-0000-000000000098', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:05:45+07:00'),
+('20000000-0000-0000-0000-000000000099', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:05:46+07:00'),
+('20000000-0000-0000-0000-000000000100', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:19:10+07:00'),
+('20000000-0000-0000-0000-000000000101', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:19:50+07:00'),
+('20000000-0000-0000-0000-000000000102', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:23:42+07:00'),
+('20000000-0000-0000-0000-000000000103', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:25:47+07:00'),
+('20000000-0000-0000-0000-000000000104', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000009', '2025-09-23 21:27:38+07:00'),
+('20000000-0000-0000-0000-000000000105', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:35:16+07:00'),
+('20000000-0000-0000-0000-000000000106', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000017', '2025-09-23 21:41:44+07:00'),
+('20000000-0000-0000-0000-000000000107', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000017', '2025-09-23 21:41:46+07:00'),
+('20000000-0000-0000-0000-000000000108', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000017', '2025-09-23 21:41:47+07:00'),
+('20000000-0000-0000-0000-000000000109', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000017', '2025-09-23 21:41:48+07:00'),
+('20000000-0000-0000-0000-000000000110', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000009', '2025-09-23 21:43:43+07:00'),
+('20000000-0000-0000-0000-000000000111', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:47:07+07:00'),
+('20000000-0000-0000-0000-000000000112', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:51:31+07:00'),
+('20000000-0000-0000-0000-000000000113', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000001', '2025-09-23 21:51:50+07:00'),
+('20000000-0000-0000-0000-000000000114', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000009', '2025-09-23 21:53:40+07:00'),
+('20000000-0000-0000-0000-000000000115', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000009', '2025-09-23 21:59:55+07:00'),
+('20000000-0000-0000-0000-000000000116', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000001', '2025-09-23 22:03:11+07:00'),
+('20000000-0000-0000-0000-000000000117', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000001', '2025-09-23 22:21:37+07:00'),
+('20000000-0000-0000-0000-000000000118', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000013', '2025-09-23 22:46:46+07:00'),
+('20000000-0000-0000-0000-000000000119', '00000000-0000-0000-0000-000000000026', '10000000-0000-0000-0000-000000000001', '2025-09-23 23:05:10+07:00'),
+('20000000-0000-0000-0000-000000000120', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000017', '2025-09-23 23:27:53+07:00'),
+('20000000-0000-0000-0000-000000000121', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000017', '2025-09-23 23:49:48+07:00'),
+('20000000-0000-0000-0000-000000000122', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000001', '2025-09-23 23:57:11+07:00'),
+('20000000-0000-0000-0000-000000000123', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000009', '2025-09-23 23:57:52+07:00'),
+('20000000-0000-0000-0000-000000000124', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000009', '2025-09-24 00:04:24+07:00'),
+('20000000-0000-0000-0000-000000000125', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000009', '2025-09-24 01:04:15+07:00'),
+('20000000-0000-0000-0000-000000000126', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000009', '2025-09-24 02:22:06+07:00'),
+('20000000-0000-0000-0000-000000000127', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000009', '2025-09-24 03:55:04+07:00'),
+('20000000-0000-0000-0000-000000000128', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000009', '2025-09-24 06:37:52+07:00'),
+('20000000-0000-0000-0000-000000000129', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000017', '2025-09-24 07:33:38+07:00'),
+('20000000-0000-0000-0000-000000000130', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000005', '2025-09-24 07:35:39+07:00'),
+('20000000-0000-0000-0000-000000000131', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000009', '2025-09-24 07:39:01+07:00'),
+('20000000-0000-0000-0000-000000000132', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000017', '2025-09-24 07:51:36+07:00'),
+('20000000-0000-0000-0000-000000000133', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:02:49+07:00'),
+('20000000-0000-0000-0000-000000000134', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:02:52+07:00'),
+('20000000-0000-0000-0000-000000000135', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:07:38+07:00'),
+('20000000-0000-0000-0000-000000000136', '00000000-0000-0000-0000-000000000003', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:09:08+07:00'),
+('20000000-0000-0000-0000-000000000137', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:09:37+07:00'),
+('20000000-0000-0000-0000-000000000138', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:15:17+07:00'),
+('20000000-0000-0000-0000-000000000139', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:23:55+07:00'),
+('20000000-0000-0000-0000-000000000140', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:28:15+07:00'),
+('20000000-0000-0000-0000-000000000141', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000002', '2025-09-24 09:34:04+07:00'),
+('20000000-0000-0000-0000-000000000142', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000002', '2025-09-24 09:34:09+07:00'),
+('20000000-0000-0000-0000-000000000143', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:42:16+07:00'),
+('20000000-0000-0000-0000-000000000144', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000006', '2025-09-24 09:49:08+07:00'),
+('20000000-0000-0000-0000-000000000145', '00000000-0000-0000-0000-000000000025', '10000000-0000-0000-0000-000000000006', '2025-09-24 10:14:48+07:00'),
+('20000000-0000-0000-0000-000000000146', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000014', '2025-09-24 10:15:26+07:00'),
+('20000000-0000-0000-0000-000000000147', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000014', '2025-09-24 10:16:56+07:00'),
+('20000000-0000-0000-0000-000000000148', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000006', '2025-09-24 10:20:25+07:00'),
+('20000000-0000-0000-0000-000000000149', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000002', '2025-09-24 10:26:22+07:00'),
+('20000000-0000-0000-0000-000000000150', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000006', '2025-09-24 10:27:41+07:00'),
+('20000000-0000-0000-0000-000000000151', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000002', '2025-09-24 10:32:02+07:00'),
+('20000000-0000-0000-0000-000000000152', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000006', '2025-09-24 10:33:45+07:00'),
+('20000000-0000-0000-0000-000000000153', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000002', '2025-09-24 10:35:33+07:00'),
+('20000000-0000-0000-0000-000000000154', '00000000-0000-0000-0000-000000000014', '10000000-0000-0000-0000-000000000006', '2025-09-24 10:38:09+07:00'),
+('20000000-0000-0000-0000-000000000155', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000005', '2025-09-24 10:40:07+07:00'),
+('20000000-0000-0000-0000-000000000156', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000002', '2025-09-24 10:59:57+07:00'),
+('20000000-0000-0000-0000-000000000157', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000006', '2025-09-24 11:01:51+07:00'),
+('20000000-0000-0000-0000-000000000158', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000002', '2025-09-24 11:16:52+07:00'),
+('20000000-0000-0000-0000-000000000159', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000014', '2025-09-24 11:51:12+07:00'),
+('20000000-0000-0000-0000-000000000160', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000014', '2025-09-24 12:08:45+07:00'),
+('20000000-0000-0000-0000-000000000161', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000006', '2025-09-24 12:18:48+07:00'),
+('20000000-0000-0000-0000-000000000162', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000014', '2025-09-24 12:55:13+07:00'),
+('20000000-0000-0000-0000-000000000163', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000006', '2025-09-24 14:45:42+07:00'),
+('20000000-0000-0000-0000-000000000164', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000002', '2025-09-24 14:59:21+07:00'),
+('20000000-0000-0000-0000-000000000165', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000018', '2025-09-24 15:43:43+07:00'),
+('20000000-0000-0000-0000-000000000166', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000018', '2025-09-24 15:43:47+07:00'),
+('20000000-0000-0000-0000-000000000167', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000010', '2025-09-24 16:40:44+07:00'),
+('20000000-0000-0000-0000-000000000168', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:12:48+07:00'),
+('20000000-0000-0000-0000-000000000169', '00000000-0000-0000-0000-000000000026', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:12:49+07:00'),
+('20000000-0000-0000-0000-000000000170', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:12:50+07:00'),
+('20000000-0000-0000-0000-000000000171', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:12:52+07:00'),
+('20000000-0000-0000-0000-000000000172', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000007', '2025-09-24 21:22:48+07:00'),
+('20000000-0000-0000-0000-000000000173', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:25:24+07:00'),
+('20000000-0000-0000-0000-000000000174', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:27:05+07:00'),
+('20000000-0000-0000-0000-000000000175', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000007', '2025-09-24 21:27:09+07:00'),
+('20000000-0000-0000-0000-000000000176', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:28:23+07:00'),
+('20000000-0000-0000-0000-000000000177', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:28:23+07:00'),
+('20000000-0000-0000-0000-000000000178', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:28:48+07:00'),
+('20000000-0000-0000-0000-000000000179', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:28:49+07:00'),
+('20000000-0000-0000-0000-000000000180', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:30:45+07:00'),
+('20000000-0000-0000-0000-000000000181', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000019', '2025-09-24 21:32:02+07:00'),
+('20000000-0000-0000-0000-000000000182', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000019', '2025-09-24 21:32:03+07:00'),
+('20000000-0000-0000-0000-000000000183', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000019', '2025-09-24 21:32:07+07:00'),
+('20000000-0000-0000-0000-000000000184', '00000000-0000-0000-0000-000000000014', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:36:15+07:00'),
+('20000000-0000-0000-0000-000000000185', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000007', '2025-09-24 21:36:50+07:00'),
+('20000000-0000-0000-0000-000000000186', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000007', '2025-09-24 21:50:13+07:00'),
+('20000000-0000-0000-0000-000000000187', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000013', '2025-09-24 21:54:28+07:00'),
+('20000000-0000-0000-0000-000000000188', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000011', '2025-09-24 21:59:11+07:00'),
+('20000000-0000-0000-0000-000000000189', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000011', '2025-09-24 22:15:21+07:00'),
+('20000000-0000-0000-0000-000000000190', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000007', '2025-09-24 22:16:53+07:00'),
+('20000000-0000-0000-0000-000000000191', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000011', '2025-09-24 22:19:03+07:00'),
+('20000000-0000-0000-0000-000000000192', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000011', '2025-09-24 22:26:47+07:00'),
+('20000000-0000-0000-0000-000000000193', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000011', '2025-09-24 22:28:53+07:00'),
+('20000000-0000-0000-0000-000000000194', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000007', '2025-09-24 22:53:11+07:00'),
+('20000000-0000-0000-0000-000000000195', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000015', '2025-09-24 23:05:18+07:00'),
+('20000000-0000-0000-0000-000000000196', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000015', '2025-09-24 23:05:22+07:00'),
+('20000000-0000-0000-0000-000000000197', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000015', '2025-09-24 23:05:23+07:00'),
+('20000000-0000-0000-0000-000000000198', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000019', '2025-09-24 23:23:37+07:00'),
+('20000000-0000-0000-0000-000000000199', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000019', '2025-09-24 23:35:49+07:00'),
+('20000000-0000-0000-0000-000000000200', '00000000-0000-0000-0000-000000000025', '10000000-0000-0000-0000-000000000007', '2025-09-24 23:51:42+07:00'),
+('20000000-0000-0000-0000-000000000201', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000007', '2025-09-25 00:37:31+07:00'),
+('20000000-0000-0000-0000-000000000202', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000019', '2025-09-25 00:43:51+07:00'),
+('20000000-0000-0000-0000-000000000203', '00000000-0000-0000-0000-000000000005', '10000000-0000-0000-0000-000000000007', '2025-09-25 00:45:38+07:00'),
+('20000000-0000-0000-0000-000000000204', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000002', '2025-09-25 01:18:26+07:00'),
+('20000000-0000-0000-0000-000000000205', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000003', '2025-09-25 04:45:24+07:00'),
+('20000000-0000-0000-0000-000000000206', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000003', '2025-09-25 04:45:26+07:00'),
+('20000000-0000-0000-0000-000000000207', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000019', '2025-09-25 06:04:00+07:00'),
+('20000000-0000-0000-0000-000000000208', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000007', '2025-09-25 06:26:04+07:00'),
+('20000000-0000-0000-0000-000000000209', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000019', '2025-09-25 06:48:50+07:00'),
+('20000000-0000-0000-0000-000000000210', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000007', '2025-09-25 07:24:56+07:00'),
+('20000000-0000-0000-0000-000000000211', '00000000-0000-0000-0000-000000000006', '10000000-0000-0000-0000-000000000007', '2025-09-25 08:18:45+07:00'),
+('20000000-0000-0000-0000-000000000212', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000015', '2025-09-25 08:42:30+07:00'),
+('20000000-0000-0000-0000-000000000213', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:04:42+07:00'),
+('20000000-0000-0000-0000-000000000214', '00000000-0000-0000-0000-000000000013', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:05:19+07:00'),
+('20000000-0000-0000-0000-000000000215', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:06:44+07:00'),
+('20000000-0000-0000-0000-000000000216', '00000000-0000-0000-0000-000000000010', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:09:14+07:00'),
+('20000000-0000-0000-0000-000000000217', '00000000-0000-0000-0000-000000000026', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:14:05+07:00'),
+('20000000-0000-0000-0000-000000000218', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:24:19+07:00'),
+('20000000-0000-0000-0000-000000000219', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:24:56+07:00'),
+('20000000-0000-0000-0000-000000000220', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:37:14+07:00'),
+('20000000-0000-0000-0000-000000000221', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000020', '2025-09-25 09:51:52+07:00'),
+('20000000-0000-0000-0000-000000000222', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000012', '2025-09-25 09:53:50+07:00'),
+('20000000-0000-0000-0000-000000000223', '00000000-0000-0000-0000-000000000011', '10000000-0000-0000-0000-000000000016', '2025-09-25 09:54:45+07:00'),
+('20000000-0000-0000-0000-000000000224', '00000000-0000-0000-0000-000000000017', '10000000-0000-0000-0000-000000000016', '2025-09-25 10:03:00+07:00'),
+('20000000-0000-0000-0000-000000000225', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000008', '2025-09-25 10:07:56+07:00'),
+('20000000-0000-0000-0000-000000000226', '00000000-0000-0000-0000-000000000007', '10000000-0000-0000-0000-000000000004', '2025-09-25 10:08:39+07:00'),
+('20000000-0000-0000-0000-000000000227', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000004', '2025-09-25 10:10:06+07:00'),
+('20000000-0000-0000-0000-000000000228', '00000000-0000-0000-0000-000000000019', '10000000-0000-0000-0000-000000000004', '2025-09-25 10:15:37+07:00'),
+('20000000-0000-0000-0000-000000000229', '00000000-0000-0000-0000-000000000016', '10000000-0000-0000-0000-000000000004', '2025-09-25 10:34:34+07:00'),
+('20000000-0000-0000-0000-000000000230', '00000000-0000-0000-0000-000000000027', '10000000-0000-0000-0000-000000000012', '2025-09-25 11:10:09+07:00'),
+('20000000-0000-0000-0000-000000000231', '00000000-0000-0000-0000-000000000018', '10000000-0000-0000-0000-000000000004', '2025-09-25 11:10:13+07:00'),
+('20000000-0000-0000-0000-000000000232', '00000000-0000-0000-0000-000000000001', '10000000-0000-0000-0000-000000000008', '2025-09-25 11:22:31+07:00'),
+('20000000-0000-0000-0000-000000000233', '00000000-0000-0000-0000-000000000023', '10000000-0000-0000-0000-000000000004', '2025-09-25 11:24:40+07:00'),
+('20000000-0000-0000-0000-000000000234', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000020', '2025-09-25 11:44:43+07:00'),
+('20000000-0000-0000-0000-000000000235', '00000000-0000-0000-0000-000000000015', '10000000-0000-0000-0000-000000000008', '2025-09-25 11:54:11+07:00'),
+('20000000-0000-0000-0000-000000000236', '00000000-0000-0000-0000-000000000008', '10000000-0000-0000-0000-000000000008', '2025-09-25 13:14:50+07:00'),
+('20000000-0000-0000-0000-000000000237', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000004', '2025-09-25 13:35:59+07:00'),
+('20000000-0000-0000-0000-000000000238', '00000000-0000-0000-0000-000000000026', '10000000-0000-0000-0000-000000000004', '2025-09-25 14:39:29+07:00'),
+('20000000-0000-0000-0000-000000000239', '00000000-0000-0000-0000-000000000028', '10000000-0000-0000-0000-000000000004', '2025-09-25 15:37:11+07:00'),
+('20000000-0000-0000-0000-000000000240', '00000000-0000-0000-0000-000000000024', '10000000-0000-0000-0000-000000000012', '2025-09-25 16:12:12+07:00'),
+('20000000-0000-0000-0000-000000000241', '00000000-0000-0000-0000-000000000020', '10000000-0000-0000-0000-000000000012', '2025-09-25 17:07:45+07:00'),
+('20000000-0000-0000-0000-000000000242', '00000000-0000-0000-0000-000000000012', '10000000-0000-0000-0000-000000000008', '2025-09-25 17:48:32+07:00'),
+('20000000-0000-0000-0000-000000000243', '00000000-0000-0000-0000-000000000014', '10000000-0000-0000-0000-000000000004', '2025-09-25 17:50:16+07:00'),
+('20000000-0000-0000-0000-000000000244', '00000000-0000-0000-0000-000000000009', '10000000-0000-0000-0000-000000000012', '2025-09-25 19:47:44+07:00')ON CONFLICT (user_id, challenge_id) DO NOTHING;